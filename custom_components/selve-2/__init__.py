@@ -1,6 +1,6 @@
 from __future__ import annotations
 from .server import SelveState
-from typing import Any, cast
+from typing import Any, Callable, cast, override
 
 from homeassistant import core
 from homeassistant.config_entries import ConfigEntry
@@ -8,14 +8,16 @@ from homeassistant.const import CONF_HOST, CONF_PASSWORD
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from datetime import timedelta
-from time import monotonic
+from time import monotonic_ns
 import logging
-import contextlib
 import asyncio
-import json
+import orjson
+import re
 import socket
 import struct
 
@@ -27,22 +29,237 @@ from .const import (
     CONF_NAME,
     CONF_DISABLE_POLLING,
     DEFAULT_UPDATE_INTERVAL,
+    SLOW_UPDATE_INTERVAL,
     PLATFORMS,
     MULTICAST_GROUP,
     MULTICAST_PORT,
+    UDP_DEBOUNCE,
+    UDP_PREFER_NS,
+    UDP_STALE_NS,
+    UDP_RCVBUF_SIZE,
+    SIGNAL_DEVICE_UPDATE,
 )
 
+from .coordinator import SelveCoordinator
 from .server import (
-    ETYPE_LABELS,
     SeleveHomeServer,
     DataStoreDict,
+    SelveCommeoState,
     SelveRawCommeoDeviceState,
     SelveStates,
+    label_for_e_type,
     parseCommeoRawFlags,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_SID_RE = re.compile(rb'"sid"\s*:\s*"([^"]+)"')
+
+
+def _commeo_model(device: SelveState) -> str:
+    device = cast(SelveCommeoState, device)
+    if device["deviceType"] != "00":
+        return "Commeo Sensor"
+    return f"Commeo {label_for_e_type(device['eType'])}".strip()
+
+
+# Device registry model, keyed by the state "type" reported by the server
+MODEL_BUILDERS: dict[str, Callable[[SelveState], str]] = {
+    "CM": _commeo_model,
+    "IV": lambda _device: "Iveo Receiver",
+    "SGROUP": lambda _device: "Device Group",
+}
+
+
+def _create_multicast_socket() -> socket.socket:
+    """Create a non-blocking UDP socket joined to the Selve multicast group."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    except OSError:
+        pass
+    try:
+        # Absorb bursts of pushes (e.g. a group move) without kernel drops
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RCVBUF_SIZE)
+    except OSError:
+        pass
+    try:
+        try:
+            # Bound to the group address the kernel drops unrelated unicast and
+            # broadcast traffic to this port; not every platform allows it (Windows)
+            sock.bind((MULTICAST_GROUP, MULTICAST_PORT))
+        except OSError:
+            sock.bind(("0.0.0.0", MULTICAST_PORT))
+        mreq = struct.pack(
+            "=4sl", socket.inet_aton(MULTICAST_GROUP), socket.INADDR_ANY
+        )
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        sock.setblocking(False)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+class SelveUdpProtocol(asyncio.DatagramProtocol):
+    """Merge STA/EVT multicast pushes from the Home Server into coordinator data."""
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[SelveStates],
+        store: DataStoreDict,
+        entry_id: str,
+    ) -> None:
+        self.coordinator: DataUpdateCoordinator[SelveStates] = coordinator
+        self.store: DataStoreDict = store
+        self.entry_id: str = entry_id
+        self._dirty: set[str] = set()
+        self._wake: asyncio.Event = asyncio.Event()
+        self._flusher: asyncio.Task[None] | None = None
+        self._pushes_seen: bool = False
+
+    def reset_push_detection(self) -> None:
+        """Let the next push switch the coordinator to slow polling again."""
+        self._pushes_seen = False
+
+    @override
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._flusher = self.coordinator.hass.async_create_background_task(
+            self._async_flush_loop(), "selve_udp_flush"
+        )
+
+    @override
+    def connection_lost(self, exc: Exception | None) -> None:
+        if self._flusher is not None:
+            _ = self._flusher.cancel()
+            self._flusher = None
+
+    @override
+    def error_received(self, exc: Exception) -> None:
+        _LOGGER.error("UDP recv error: %s", exc)
+
+    async def _async_flush_loop(self) -> None:
+        """Notify the coordinator once per burst of pushes."""
+        while True:
+            _ = await self._wake.wait()
+            # Let adjacent packets of one group command land in the same refresh
+            await asyncio.sleep(UDP_DEBOUNCE)
+            self._wake.clear()
+            dirty, self._dirty = self._dirty, set()
+            # Only the entities of pushed devices need a state write
+            for sid in dirty:
+                async_dispatcher_send(
+                    self.coordinator.hass,
+                    SIGNAL_DEVICE_UPDATE.format(self.entry_id, sid),
+                )
+
+    @override
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:  # pyright: ignore[reportExplicitAny]
+        coordinator = self.coordinator
+        store = self.store
+        if not (data.startswith(b"STA:") or data.startswith(b"EVT:")):
+            _LOGGER.warning(
+                "Selve UDP: unexpected prefix: addr=%s msg=%s",
+                addr,
+                data,
+            )
+            return
+        _LOGGER.debug("Selve UDP: %s", data)
+        # Cheap reject of pushes for devices we do not track before a full parse
+        match = _SID_RE.search(data, 4)
+        if match is None:
+            return
+        if match.group(1).decode(errors="replace") not in coordinator.data:
+            return
+        # Parse straight out of the datagram buffer instead of copying the payload
+        payload = memoryview(data)[4:]
+        try:
+            j = cast(dict[str, Any], orjson.loads(payload))  # pyright: ignore[reportExplicitAny]
+        except orjson.JSONDecodeError as err:
+            _LOGGER.warning(
+                "Selve UDP: invalid JSON: %s (%s)", bytes(payload[:200]), err
+            )
+            return
+
+        sid = cast(str, j.get("sid"))
+        if not sid:
+            return
+        dev: SelveState | None = coordinator.data.get(sid)
+        if not dev:
+            return
+
+        changed_values: list[str] | None = j.get("changed") or None
+        udp_state = j.get("state") or {}
+        if changed_values is not None and len(changed_values) == 7:
+            if "state" not in dev:
+                return
+            dev_state = dev["state"]
+            if not isinstance(dev_state, dict):
+                return
+            last_run_state = dev_state.get("run_state")
+            if last_run_state == 0:  # didn't move last update
+                all_values = [
+                    "overload",
+                    "obstacle",
+                    "alarm",
+                    "position",
+                    "current",
+                    "target",
+                    "running_state",
+                ]
+                if set(changed_values) == set(
+                    all_values
+                ):  # this is likely a wrong state
+                    run_state = cast(int | None, udp_state.get("run_state", None))
+                    position = cast(int | None, udp_state.get("position", None))
+                    current = cast(int | None, udp_state.get("current", None))
+                    target = cast(int | None, udp_state.get("target", None))
+                    timeout = cast(int | None, udp_state.get("timeout", None))
+                    if (
+                        run_state == 0
+                        and position == 0
+                        and current == 100
+                        and target == 100
+                        and timeout == 0
+                    ):
+                        _LOGGER.warning(
+                            "Selve UDP: ignoring likely wrong state for %s: %s",
+                            sid,
+                            udp_state,
+                        )
+                        return
+
+        # Normalize flags -> attributes for Commeo receivers so binary_sensors update from UDP.
+        # Packets without flags must not clear parsed_flags on the device.
+        if dev["type"] == "CM" and "flags" in udp_state:
+            try:
+                parsed_falgs = parseCommeoRawFlags(
+                    cast(SelveRawCommeoDeviceState, udp_state)
+                )
+                udp_state["parsed_flags"] = parsed_falgs
+            except Exception:
+                coordinator.logger.error(
+                    "Error parsing Commeo flags from UDP for device %s udp_state %s",
+                    dev,
+                    udp_state,
+                )
+        if "state" in dev and isinstance(dev["state"], dict):
+            # Replace rather than mutate so listeners can detect changes by identity
+            coordinator.data[sid] = cast(
+                SelveState, {**dev, "state": {**dev["state"], **udp_state}}
+            )
+            store["udp_last"][sid] = {"state": udp_state, "ts": monotonic_ns()}
+            if not self._pushes_seen:
+                # Pushes work on this network; polling is only a drift safety net now
+                self._pushes_seen = True
+                if coordinator.update_interval is not None:
+                    coordinator.update_interval = timedelta(
+                        seconds=SLOW_UPDATE_INTERVAL
+                    )
+            # Notify entities once per burst instead of once per packet
+            self._dirty.add(sid)
+            self._wake.set()
+
 
 async def async_setup(_hass: core.HomeAssistant, _config: ConfigType) -> bool:
     """Set up integration."""
@@ -56,35 +273,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     custom_server_name: str | None = entry.data.get(CONF_NAME)
 
     disable_polling: bool = cast(bool, entry.options.get(CONF_DISABLE_POLLING, False))
-    api = SeleveHomeServer(host, password)
-    server_info = await hass.async_add_executor_job(api.get_server_info)
-    states = await hass.async_add_executor_job(api.get_states)
+    api = SeleveHomeServer(host, password, async_get_clientsession(hass))
+    # Independent requests, so issue them together
+    server_info, states = await asyncio.gather(
+        api.async_get_server_info(), api.async_get_states()
+    )
     if states is None:
         raise UpdateFailed("No data received from Selve Home Server")
 
+    default_interval = timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
+
     async def async_update_data() -> SelveStates:
         try:
-            new_states = await hass.async_add_executor_job(api.get_states)
+            new_states = await api.async_get_states()
             if new_states is None:
                 raise UpdateFailed("No data received from Selve Home Server")
         except Exception as err:
             raise UpdateFailed(str(err)) from err
 
         udp_last = store.get("udp_last", {})
-        now = monotonic()
+        now = monotonic_ns()
         for sid, dev in new_states.items():
             if "state" not in dev or not isinstance(dev["state"], dict):
                 continue
             udp_entry = udp_last.get(sid)
             if not udp_entry:
                 continue
+            udp_age = now - udp_entry.get("ts", 0)
+            if udp_age > UDP_STALE_NS:
+                # Already reconciled by earlier polls, nothing left to compare
+                del udp_last[sid]
+                continue
             udp_state = udp_entry.get("state", {})
-            ts = udp_entry.get("ts", 0)
+            udp_recent = udp_age <= UDP_PREFER_NS
             for k, udp_val in udp_state.items():
                 api_val = dev["state"].get(k)
                 if api_val != udp_val:
                     # If UDP is recent, silently prefer it; otherwise, warn about mismatch
-                    if now - ts <= 20:
+                    if udp_recent:
                         dev["state"][k] = udp_val
                     else:
                         _LOGGER.warning(
@@ -94,29 +320,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                             api_val,
                             udp_val,
                         )
+
+        # Keep unchanged devices as the previous objects so entities can skip them
+        old_states = coordinator.data or {}
+        push_missed = False
+        for sid, dev in new_states.items():
+            old_dev = old_states.get(sid)
+            if old_dev is None:
+                continue
+            if old_dev == dev:
+                new_states[sid] = old_dev
+                continue
+            if old_dev.get("state") != dev.get("state"):
+                udp_entry = udp_last.get(sid)
+                # A state change no recent push told us about means pushes get lost
+                if udp_entry is None or now - udp_entry.get("ts", 0) > UDP_PREFER_NS:
+                    push_missed = True
+
+        if push_missed and coordinator.update_interval != default_interval:
+            coordinator.update_interval = default_interval
+            transport = store["udp_transport"]
+            if transport is not None:
+                cast(SelveUdpProtocol, transport.get_protocol()).reset_push_detection()
         return new_states
 
-    coordinator: DataUpdateCoordinator[SelveStates]
+    coordinator: SelveCoordinator
 
     if disable_polling:
 
         async def _return_states() -> SelveStates:
             return states
 
-        coordinator = DataUpdateCoordinator[SelveStates](
+        coordinator = SelveCoordinator(
             hass,
             _LOGGER,
             name=f"Selve Home Server {host}",
             update_method=_return_states,
             update_interval=None,
+            always_update=False,
         )
     else:
-        coordinator = DataUpdateCoordinator[SelveStates](
+        coordinator = SelveCoordinator(
             hass,
             _LOGGER,
             name=f"Selve Home Server {host}",
             update_method=async_update_data,
-            update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+            update_interval=default_interval,
+            always_update=False,
         )
     coordinator.logger.debug("Polling is enabled: %s", not disable_polling)
     store: DataStoreDict = {
@@ -125,7 +375,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         DATA_DEVICES: states,
         "udp_last": {},
         "coordinator": coordinator,
-        "udp_task": None,
+        "udp_transport": None,
     }
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = store
@@ -133,10 +383,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
 
     dev_reg = dr.async_get(hass)
+    server_identifier = (DOMAIN, f"server_{server_info['mac']}")
     # Create main server device
     _ = dev_reg.async_get_or_create(
         config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, f"server_{server_info['mac']}")},
+        identifiers={server_identifier},
         manufacturer="Selve",
         name=custom_server_name or f"Selve Home Server ({host})",
         model=f"Home Server 2 ({server_info['mhv']})",
@@ -145,140 +396,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     for sid, device in states.items():
-        # Determine model based on device class
-        if device["type"] == "CM":
-            if device["deviceType"] == "00":
-                model = f"Commeo {ETYPE_LABELS[device['eType']]}".strip()
-            else:
-                model = "Commeo Sensor"
-        elif device.__class__.__name__ == "IveoReceiverState":
-            model = "Iveo Receiver"
-        elif device.__class__.__name__ == "DeviceGroupState":
-            model = "Device Group"
-        else:
-            model = "Unknown"
+        model_builder = MODEL_BUILDERS.get(device["type"])
+        model = model_builder(device) if model_builder else "Unknown"
 
         _ = dev_reg.async_get_or_create(
             config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, f"{sid}")},
+            identifiers={(DOMAIN, sid)},
             manufacturer="Selve",
             name=device.get("name") or f"Device {sid}",
             model=model,
-            via_device=(DOMAIN, f"server_{server_info['mac']}"),
+            via_device=server_identifier,
         )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    async def _udp_listener():
-        loop = asyncio.get_running_loop()
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-        try:
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        except OSError:
-            pass
-        sock.bind(("0.0.0.0", MULTICAST_PORT))
-        mreq = struct.pack("=4sl", socket.inet_aton(MULTICAST_GROUP), socket.INADDR_ANY)
-        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
-        sock.setblocking(False)
-
-        while True:
-            _LOGGER.warning("UDP wait")
-            try:
-                data, addr = await loop.sock_recvfrom(sock, 65535)  # pyright: ignore[reportAny]
-            except asyncio.CancelledError as err:
-                _LOGGER.error("UDP listener cancelled")
-                raise err
-            except Exception as err:
-                _LOGGER.error("UDP recv error: %s", err)
-                await asyncio.sleep(0.1)
-                continue
-
-            msg = data.decode("utf-8", errors="replace").strip()
-            if not (msg.startswith("STA:") or msg.startswith("EVT:")):
-                _LOGGER.warning(
-                    "Selve UDP: unexpected prefix: addr=%s msg=%s",
-                    addr,  # pyright: ignore[reportAny]
-                    msg,
-                )
-                continue
-            _LOGGER.error("Selve UDP: %s", msg)
-            payload = msg[4:]
-            try:
-                j = cast(dict[str, Any], json.loads(payload))  # pyright: ignore[reportExplicitAny]
-            except Exception as err:
-                _LOGGER.warning("Selve UDP: invalid JSON: %s (%s)", payload[:200], err)
-                continue
-
-            sid = cast(str, j.get("sid"))
-            if not sid:
-                continue
-            dev: SelveState | None = coordinator.data.get(sid)
-            if not dev:
-                continue
-
-            changed_values: list[str] | None = j.get("changed") or None
-            udp_state = j.get("state") or {}
-            if changed_values is not None and len(changed_values) == 7:
-                if "state" not in dev:
-                    continue
-                dev_state = dev["state"]
-                if not isinstance(dev_state, dict):
-                    continue
-                last_run_state = dev_state.get("run_state")
-                if last_run_state == 0:  # didn't move last update
-                    all_values = [
-                        "overload",
-                        "obstacle",
-                        "alarm",
-                        "position",
-                        "current",
-                        "target",
-                        "running_state",
-                    ]
-                    if set(changed_values) == set(
-                        all_values
-                    ):  # this is likely a wrong state
-                        run_state = cast(int | None, udp_state.get("run_state", None))
-                        position = cast(int | None, udp_state.get("position", None))
-                        current = cast(int | None, udp_state.get("current", None))
-                        target = cast(int | None, udp_state.get("target", None))
-                        timeout = cast(int | None, udp_state.get("timeout", None))
-                        if (
-                            run_state == 0
-                            and position == 0
-                            and current == 100
-                            and target == 100
-                            and timeout == 0
-                        ):
-                            _LOGGER.warning(
-                                "Selve UDP: ignoring likely wrong state for %s: %s",
-                                sid,
-                                udp_state,
-                            )
-                            continue
-
-            # Normalize flags -> attributes for Commeo receivers so binary_sensors update from UDP
-            if dev["type"] == "CM":
-                try:
-                    parsed_falgs = parseCommeoRawFlags(
-                        cast(SelveRawCommeoDeviceState, udp_state)
-                    )
-                    udp_state["parsed_flags"] = parsed_falgs
-                except Exception:
-                    coordinator.logger.error(
-                        "Error parsing Commeo flags from UDP for device %s udp_state %s",
-                        dev,
-                        udp_state,
-                    )
-            if "state" in dev and isinstance(dev["state"], dict):
-                dev["state"].update(udp_state)
-                coordinator.data[sid] = dev
-                store["udp_last"][sid] = {"state": udp_state, "ts": monotonic()}
-                # Notify entities
-                coordinator.async_set_updated_data(coordinator.data)
-
-    task = hass.loop.create_task(_udp_listener())
-    store["udp_task"] = task
+    try:
+        sock = _create_multicast_socket()
+        transport, _ = await hass.loop.create_datagram_endpoint(
+            lambda: SelveUdpProtocol(coordinator, store, entry.entry_id), sock=sock
+        )
+    except OSError as err:
+        _LOGGER.error("Selve UDP: unable to join multicast group: %s", err)
+    else:
+        store["udp_transport"] = transport
     return True
 
 
@@ -286,12 +426,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry_store = cast(dict[str, DataStoreDict], hass.data.get(DOMAIN, {})).get(
         entry.entry_id
     )
-    # Cancel UDP listener
-    udp_task = entry_store.get("udp_task") if entry_store else None
-    if udp_task:
-        _ = udp_task.cancel()
-        with contextlib.suppress(Exception):
-            await udp_task
+    # Stop UDP listener
+    udp_transport = entry_store.get("udp_transport") if entry_store else None
+    if udp_transport:
+        udp_transport.close()
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
@@ -1,4 +1,4 @@
-from functools import cached_property
+from types import MappingProxyType
 from typing import cast, override
 
 from homeassistant.components.binary_sensor import (
@@ -11,26 +11,38 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from .const import DOMAIN, DATA_API, DATA_SERVER_INFO
+from .entity import SelveDeviceEntity
 from .server import (
     DataStoreDict,
     SeleveHomeServer,
     SelveCommeoState,
+    SelveState,
     SelveStates,
 )
 
 
-FLAG_TO_DEVICE_CLASS: dict[str, BinarySensorDeviceClass | None] = {
-    "timeout": BinarySensorDeviceClass.PROBLEM,
-    "overload": BinarySensorDeviceClass.PROBLEM,
-    "obstacle": BinarySensorDeviceClass.PROBLEM,
-    "emergency_alarm": BinarySensorDeviceClass.SAFETY,
-    "sensor_learned": None,
-    "sensor_connected": BinarySensorDeviceClass.CONNECTIVITY,
-    "cc_timeout": None,
-    "wind_alarm": BinarySensorDeviceClass.SAFETY,
-    "rain_alarm": BinarySensorDeviceClass.SAFETY,
-    "frost_alarm": BinarySensorDeviceClass.COLD,
-}
+FLAG_TO_DEVICE_CLASS: MappingProxyType[str, BinarySensorDeviceClass | None] = (
+    MappingProxyType(
+        {
+            "timeout": BinarySensorDeviceClass.PROBLEM,
+            "overload": BinarySensorDeviceClass.PROBLEM,
+            "obstacle": BinarySensorDeviceClass.PROBLEM,
+            "emergency_alarm": BinarySensorDeviceClass.SAFETY,
+            "sensor_learned": None,
+            "sensor_connected": BinarySensorDeviceClass.CONNECTIVITY,
+            "cc_timeout": None,
+            "wind_alarm": BinarySensorDeviceClass.SAFETY,
+            "rain_alarm": BinarySensorDeviceClass.SAFETY,
+            "frost_alarm": BinarySensorDeviceClass.COLD,
+        }
+    )
+)
+
+# (flag, device class, display name) built once instead of per entity
+FLAG_SPECS: tuple[tuple[str, BinarySensorDeviceClass | None, str], ...] = tuple(
+    (flag, device_class, flag.replace("_", " ").title())
+    for flag, device_class in FLAG_TO_DEVICE_CLASS.items()
+)
 
 
 async def async_setup_entry(
@@ -38,75 +50,78 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddConfigEntryEntitiesCallback,
 ):
-    data = cast(DataStoreDict, hass.data[DOMAIN][entry.entry_id])
+    data: DataStoreDict = hass.data[DOMAIN][entry.entry_id]
     api: SeleveHomeServer = data[DATA_API]
     coordinator = data["coordinator"]
     server_info = data[DATA_SERVER_INFO]
     parent_identifier = (DOMAIN, f"server_{server_info['mac']}")
 
     entities: list[BinarySensorEntity] = []
-    for sid, dev in coordinator.data.items():
-        if dev["type"] != "CM":
-            continue
-        for flag_name in FLAG_TO_DEVICE_CLASS.keys():
+    commeo_sids = [
+        sid
+        for (state_type, _device_type), sids in coordinator.sids_by_kind().items()
+        if state_type == "CM"
+        for sid in sids
+    ]
+    for sid in commeo_sids:
+        dev = cast(SelveCommeoState, coordinator.data[sid])
+        device_name = dev["name"] or f"Receiver {sid}"
+        # All flag sensors of a receiver share one device info mapping
+        device_info: DeviceInfo = {
+            "identifiers": {(DOMAIN, sid)},
+            "via_device": parent_identifier,
+        }
+        for flag_name, device_class, flag_pretty in FLAG_SPECS:
             entities.append(
                 SelveFlagBinarySensor(
                     api,
                     coordinator,
+                    entry.entry_id,
                     sid,
                     flag_name,
-                    parent_identifier,
-                    device_class=FLAG_TO_DEVICE_CLASS[flag_name],
-                    device_name=dev["name"] or f"Receiver {sid}",
+                    device_info,
+                    device_class=device_class,
+                    device_name=device_name,
+                    flag_pretty=flag_pretty,
                 )
             )
 
-    async_add_entities(entities)
+    if entities:
+        async_add_entities(entities)
+
 
+class SelveFlagBinarySensor(SelveDeviceEntity, BinarySensorEntity):
+    __slots__ = ("_flag",)
 
-class SelveFlagBinarySensor(BinarySensorEntity):
     def __init__(
         self,
         api: SeleveHomeServer,
         coordinator: DataUpdateCoordinator[SelveStates],
+        entry_id: str,
         sid: str,
         flag: str,
-        parent_identifier: tuple[str, str],
+        device_info: DeviceInfo,
         device_class: BinarySensorDeviceClass | None,
         device_name: str,
+        flag_pretty: str,
     ) -> None:
-        self.coordinator: DataUpdateCoordinator[SelveStates] = coordinator
-        self.api: SeleveHomeServer = api
-        self._sid: str = sid
+        super().__init__(api, coordinator, entry_id, sid)
         self._flag: str = flag
         self._attr_unique_id: str | None = f"{DOMAIN}_{sid}_flag_{flag}"
-        self._attr_name: str | None = f"{device_name} {flag.replace('_', ' ').title()}"
+        self._attr_name: str | None = f"{device_name} {flag_pretty}"
         self._attr_device_class: BinarySensorDeviceClass | None = device_class
-        self._attr_device_info: DeviceInfo | None = {
-            "identifiers": {(DOMAIN, sid)},
-            "via_device": parent_identifier,
-        }
+        self._attr_device_info: DeviceInfo | None = device_info
+        self._update_from(self._last_dev)
 
-    @cached_property
     @override
-    def is_on(self) -> bool | None:
-        dev = cast(SelveCommeoState | None, self.coordinator.data.get(self._sid))
-        if dev is None or dev.get("type") != "CM":
-            return None
-        flags = dev["state"].get("parsed_flags")
-        if not flags:
-            return None
+    def _update_from(self, dev: SelveState | None) -> None:
+        if dev is None or dev["type"] != "CM":
+            self._attr_is_on = None
+            return
+        flags = dev["state"].get("parsed_flags") or {}
         val = flags.get(self._flag)
-        if val is None:
-            return None
-        return cast(bool, val)
+        self._attr_is_on = None if val is None else bool(val)
 
     @override
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
-
-    def _handle_coordinator_update(self) -> None:
-        self.__dict__.pop("is_on", None)
-        self.async_write_ha_state()
+    def _observed_state(self) -> object:
+        return self._attr_is_on
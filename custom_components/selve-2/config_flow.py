@@ -1,24 +1,55 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import cast, override
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigFlowResult
 from homeassistant.const import CONF_HOST, CONF_PASSWORD
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import DOMAIN, CONF_NAME, CONF_DISABLE_POLLING
 
-from .server import SeleveHomeServer
+from .server import SeleveHomeServer, ServerInfo
 
 
-async def _validate_input(hass: HomeAssistant, data: dict[str, str]):
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+
+
+# Shown again after an error, prefilled per call via suggested values so the
+# entered credentials are never kept in a shared schema
+_USER_SCHEMA_WITH_NAME = _USER_SCHEMA.extend({vol.Optional(CONF_NAME): str})
+
+
+@lru_cache(maxsize=16)
+def _name_schema(default_name: str):
+    return vol.Schema(
+        {
+            vol.Optional(CONF_NAME, default=default_name): str,
+            vol.Optional(CONF_DISABLE_POLLING, default=False): bool,
+        }
+    )
+
+
+@lru_cache(maxsize=2)
+def _options_schema(polling_disabled: bool):
+    return vol.Schema(
+        {vol.Optional(CONF_DISABLE_POLLING, default=polling_disabled): bool}
+    )
+
+
+async def _validate_input(hass: HomeAssistant, data: dict[str, str]) -> ServerInfo:
     """Validate connection and return server_info object."""
     host = data[CONF_HOST]
     password = data[CONF_PASSWORD]
-    api = SeleveHomeServer(host, password)
-    server_info = await hass.async_add_executor_job(api.get_server_info)
-    return server_info
+    api = SeleveHomeServer(host, password, async_get_clientsession(hass))
+    return await api.async_get_server_info()
 
 
 class SelveConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -46,29 +77,13 @@ class SelveConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             return self.async_show_form(
                 step_id="user",
-                data_schema=vol.Schema(
-                    {
-                        vol.Required(CONF_HOST, default=user_input.get(CONF_HOST)): str,
-                        vol.Required(
-                            CONF_PASSWORD, default=user_input.get(CONF_PASSWORD)
-                        ): str,
-                        vol.Optional(
-                            CONF_NAME, default=user_input.get(CONF_NAME, "")
-                        ): str,
-                    }
+                data_schema=self.add_suggested_values_to_schema(
+                    _USER_SCHEMA_WITH_NAME, user_input
                 ),
                 errors=errors,
             )
 
-        return self.async_show_form(
-            step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST): str,
-                    vol.Required(CONF_PASSWORD): str,
-                }
-            ),
-        )
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA)
 
     async def async_step_name(
         self, user_input: dict[str, str] | None = None
@@ -86,15 +101,7 @@ class SelveConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="name",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_NAME,
-                        default=self._recommended_name or "Selve Home Server",
-                    ): str,
-                    vol.Optional(CONF_DISABLE_POLLING, default=False): bool,
-                }
-            ),
+            data_schema=_name_schema(self._recommended_name or "Selve Home Server"),
             description_placeholders={"suggestion": self._recommended_name or ""},
         )
 
@@ -121,7 +128,5 @@ class SelveOptionsFlowHandler(config_entries.OptionsFlowWithReload):
         )
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {vol.Optional(CONF_DISABLE_POLLING, default=polling_disabled): bool}
-            ),
+            data_schema=_options_schema(polling_disabled),
         )
@@ -9,9 +9,18 @@ DATA_API = "api"
 DATA_SERVER_INFO = "server_info"
 DATA_DEVICES = "devices"
 
+# Dispatcher signal for UDP pushes, formatted with (entry_id, sid)
+SIGNAL_DEVICE_UPDATE = "selve_device_update_{}_{}"
+
 PLATFORMS: list[str] = ["cover", "binary_sensor", "switch"]
 
 DEFAULT_UPDATE_INTERVAL = 30  # seconds
+SLOW_UPDATE_INTERVAL = 300  # seconds, used once UDP pushes are arriving
+FALLBACK_REFRESH_DELAY = 2  # seconds to wait for a UDP push after a command
 
 MULTICAST_GROUP = "239.255.255.250"
 MULTICAST_PORT = 1901
+UDP_DEBOUNCE = 0.05  # seconds to coalesce bursts of UDP state pushes
+UDP_RCVBUF_SIZE = 1024 * 1024  # bytes
+UDP_PREFER_NS = 20 * 1_000_000_000  # UDP values newer than this win over a poll
+UDP_STALE_NS = 600 * 1_000_000_000  # udp_last entries older than this are dropped
@@ -0,0 +1,57 @@
+from typing import override
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .server import SelveStates
+
+DeviceKind = tuple[str, str]
+"""(type, deviceType); deviceType is only meaningful for Commeo, else empty."""
+
+
+class SelveCoordinator(DataUpdateCoordinator[SelveStates]):
+    """Coordinator for one Selve Home Server with its devices indexed by kind."""
+
+    _indexed_data: SelveStates | None = None
+    _sids_by_kind: dict[DeviceKind, list[str]]
+    _notified_data: SelveStates | None = None
+    _notified_success: bool = True
+
+    @callback
+    @override
+    def async_update_listeners(self) -> None:
+        """Notify only listeners whose device dict changed since the last call.
+
+        Entities register with their device sid as context. A refresh keeps the
+        dict object of unchanged devices, so those listeners are skipped;
+        availability changes and listeners without a context always fire.
+        """
+        data = self.data
+        previous = self._notified_data
+        self._notified_data = dict(data) if data is not None else None
+        success = self.last_update_success
+        if previous is None or data is None or success != self._notified_success:
+            self._notified_success = success
+            super().async_update_listeners()
+            return
+        dirty = {sid for sid, dev in data.items() if previous.get(sid) is not dev}
+        dirty.update(previous.keys() - data.keys())
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in dirty:
+                update_callback()
+
+    def sids_by_kind(self) -> dict[DeviceKind, list[str]]:
+        """Return device sids grouped by (type, deviceType).
+
+        Rebuilt only when a refresh replaced the data dict; UDP pushes update
+        devices inside the same dict and never change their kind.
+        """
+        data = self.data
+        if data is not self._indexed_data:
+            index: dict[DeviceKind, list[str]] = {}
+            for sid, dev in data.items():
+                kind = (dev["type"], dev["deviceType"] if dev["type"] == "CM" else "")
+                index.setdefault(kind, []).append(sid)
+            self._sids_by_kind = index
+            self._indexed_data = data
+        return self._sids_by_kind
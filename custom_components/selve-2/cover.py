@@ -1,26 +1,46 @@
-from functools import cached_property
-from typing import Any, Literal, cast, override
+from abc import abstractmethod
+from datetime import datetime
+from typing import Any, Callable, Literal, cast, override
 from homeassistant.components.cover import (
     CoverEntity,
     CoverEntityFeature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.config_entries import ConfigEntry
 
-from .const import DOMAIN, DATA_API, DATA_SERVER_INFO
+from .const import DOMAIN, DATA_API, DATA_SERVER_INFO, FALLBACK_REFRESH_DELAY
+from .coordinator import DeviceKind
+from .entity import SelveDeviceEntity
 from .server import (
+    CommeoEType,
     DataStoreDict,
     SeleveHomeServer,
     SelveCommeoState,
     SelveIveoState,
+    SelveState,
     SelveStates,
 )
 
-# Motor related eTypes (0..7 plus ROLLER_SHUTTER etc.)
-MOTOR_ETYPES = {0, 1, 2, 3, 4, 5, 6, 7}
+# Motor related eTypes are the contiguous range 0..7 (BLIND_INSIDE..FOLDING_SHUTTER)
+MOTOR_ETYPE_MAX = int(CommeoEType.FOLDING_SHUTTER)
+
+_CM_FEATURES = (
+    CoverEntityFeature.OPEN
+    | CoverEntityFeature.CLOSE
+    | CoverEntityFeature.STOP
+    | CoverEntityFeature.SET_POSITION
+)
+_IV_FEATURES = (
+    CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE | CoverEntityFeature.STOP
+)
+
+
+def _is_commeo_motor(dev: SelveState) -> bool:
+    return 0 <= cast(SelveCommeoState, dev)["eType"] <= MOTOR_ETYPE_MAX
 
 
 async def async_setup_entry(
@@ -28,7 +48,7 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddConfigEntryEntitiesCallback,
 ):
-    data = cast(DataStoreDict, hass.data[DOMAIN][entry.entry_id])
+    data: DataStoreDict = hass.data[DOMAIN][entry.entry_id]
     api: SeleveHomeServer = data[DATA_API]
     coordinator = data["coordinator"]
     server_info = data[DATA_SERVER_INFO]
@@ -37,24 +57,30 @@ async def async_setup_entry(
         f"server_{server_info['mac']}",
     )
     states = coordinator.data
+    sids_by_kind = coordinator.sids_by_kind()
 
     entities: list[CoverEntity] = []
-    for dev in states.values():
-        if dev["type"] == "CM" and dev["deviceType"] == "00":
-            eTypeCode = dev["eType"]
-            if eTypeCode in MOTOR_ETYPES:
+    for kind, (accepts, cover_cls) in COVER_DEVICE_TYPES.items():
+        for sid in sids_by_kind.get(kind, ()):
+            dev = states[sid]
+            if accepts(dev):
                 entities.append(
-                    SelveCover(api, coordinator, entry.entry_id, dev, parent_identifier)
+                    cover_cls(
+                        api,
+                        coordinator,
+                        entry.entry_id,
+                        cast(SelveCommeoState | SelveIveoState, dev),
+                        parent_identifier,
+                    )
                 )
-        elif dev["type"] == "IV":
-            entities.append(
-                SelveCover(api, coordinator, entry.entry_id, dev, parent_identifier)
-            )
-    async_add_entities(entities)
+    if entities:
+        async_add_entities(entities)
 
 
-class SelveCover(CoverEntity):
-    """Cover entity for Commeo motor receivers (with position)."""
+class SelveCoverBase(SelveDeviceEntity, CoverEntity):
+    """Shared command and update handling for Selve receivers driving a cover."""
+
+    __slots__ = ("_dev", "_unsub_fallback_refresh")
 
     def __init__(
         self,
@@ -64,97 +90,181 @@ class SelveCover(CoverEntity):
         dev: SelveCommeoState | SelveIveoState,
         parent_identifier: tuple[str, str],
     ):
-        self.coordinator: DataUpdateCoordinator[SelveStates] = coordinator
-        self.api: SeleveHomeServer = api
+        super().__init__(api, coordinator, entry_id, dev["sid"])
         self._dev: SelveCommeoState | SelveIveoState = dev
+        self._unsub_fallback_refresh: CALLBACK_TYPE | None = None
         self._attr_unique_id: str | None = f"{DOMAIN}_{dev['sid']}"
         self._attr_name: str | None = dev.get("name") or f"Receiver {dev['sid']}"
         self._attr_device_info: DeviceInfo | None = {
             "identifiers": {(DOMAIN, dev["sid"])},
             "via_device": parent_identifier,
         }
-        if dev["type"] == "CM":
-            self._attr_supported_features: CoverEntityFeature | None = (  # pyright: ignore[reportRedeclaration]
-                CoverEntityFeature.OPEN
-                | CoverEntityFeature.CLOSE
-                | CoverEntityFeature.STOP
-                | CoverEntityFeature.SET_POSITION
-            )
-        elif dev["type"] == "IV":
-            self._attr_supported_features: CoverEntityFeature | None = (
-                CoverEntityFeature.OPEN
-                | CoverEntityFeature.CLOSE
-                | CoverEntityFeature.STOP
-            )
-
-    @cached_property
-    def current_cover_position(self) -> int | None:
-        if self._dev["type"] != "CM":
-            return None
-        if self._dev["state"]["position"] == "-":
-            return None
-        return 100 - int(self._dev["state"]["position"])
-
-    @cached_property
-    def is_closed(self) -> bool | None:
-        if self._dev["type"] == "IV":
-            state = self._dev["state"]
-            return state == "closed"
-        pos = self.current_cover_position
-        if pos is None:
-            return None
-        # Assume 0 = fully closed
-        return pos == 0
+        self._update_cached_state()
+
+    @abstractmethod
+    def _update_cached_state(self) -> None:
+        """Derive the values HA reads on every state write from the device dict."""
+
+    @abstractmethod
+    def _expected_dev(self, raw_position: int) -> SelveCommeoState | SelveIveoState:
+        """Return the device dict once it reached raw_position (0 = open)."""
 
     @override
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
+    def _update_from(self, dev: SelveState | None) -> None:
+        if dev is not None:
+            self._dev = cast(SelveCommeoState | SelveIveoState, dev)
+        # Fresh data from the server replaces any optimistic direction
+        self._attr_is_opening = None
+        self._attr_is_closing = None
+        if self._unsub_fallback_refresh is not None:
+            self._unsub_fallback_refresh()
+            self._unsub_fallback_refresh = None
+        self._update_cached_state()
+
+    @override
+    def _observed_state(self) -> object:
+        return (
+            self._attr_current_cover_position,
+            self._attr_is_closed,
+            self._attr_is_opening,
+            self._attr_is_closing,
+            self._attr_extra_state_attributes,
         )
 
-    def _handle_coordinator_update(self) -> None:
-        updated = self.coordinator.data.get(self._dev["sid"])
-        if updated is not None:
-            self._dev = cast(SelveCommeoState | SelveIveoState, updated)
-        self.__dict__.pop("current_cover_position", None)
-        self.__dict__.pop("is_closed", None)
-        self.__dict__.pop("extra_state_attributes", None)
+    @override
+    async def async_will_remove_from_hass(self) -> None:
+        await super().async_will_remove_from_hass()
+        if self._unsub_fallback_refresh is not None:
+            self._unsub_fallback_refresh()
+            self._unsub_fallback_refresh = None
+
+    def _apply_expected_position(self, raw_position: int) -> None:
+        """Store the position the device is heading to (raw 0 = open)."""
+        expected = self._expected_dev(raw_position)
+        # Copy-on-write so sibling entities still see their dict as unchanged
+        self.coordinator.data[self._sid] = expected
+        self._last_dev = expected
+        self._dev = expected
+        self._update_cached_state()
+
+    async def _async_send(
+        self,
+        cmd: str,
+        value: int | None = None,
+        opening: bool | None = None,
+        expected_position: int | None = None,
+    ) -> None:
+        """Send a command and show the expected movement until UDP confirms it."""
+        # Raises before any optimistic state is applied if the server refuses
+        await self._async_send_command(cmd, value)
+        if expected_position is not None:
+            self._apply_expected_position(expected_position)
+        self._attr_is_opening = opening is True
+        self._attr_is_closing = opening is False
         self.async_write_ha_state()
+        # The server pushes the new state via UDP; fall back if that got lost
+        if self._unsub_fallback_refresh is not None:
+            self._unsub_fallback_refresh()
+        self._unsub_fallback_refresh = async_call_later(
+            self.hass, FALLBACK_REFRESH_DELAY, self._async_fallback_refresh
+        )
+
+    async def _async_fallback_refresh(self, _now: datetime) -> None:
+        self._unsub_fallback_refresh = None
+        if self.coordinator.update_interval is not None:
+            await self.coordinator.async_request_refresh()
+        # A refresh returning unchanged data notifies nobody, so the optimistic
+        # direction has to be dropped here as well
+        if self._attr_is_opening or self._attr_is_closing:
+            self._attr_is_opening = None
+            self._attr_is_closing = None
+            self.async_write_ha_state()
 
     @override
     async def async_open_cover(self, **kwargs: Any) -> None:  # pyright: ignore[reportAny, reportExplicitAny]
-        _ = await self.hass.async_add_executor_job(
-            self.api.send_command, self._dev["sid"], "moveUp"
-        )
+        await self._async_send("moveUp", opening=True, expected_position=0)
 
     @override
     async def async_close_cover(self, **kwargs: Any) -> None:  # pyright: ignore[reportAny, reportExplicitAny]
-        _ = await self.hass.async_add_executor_job(
-            self.api.send_command, self._dev["sid"], "moveDown"
-        )
+        await self._async_send("moveDown", opening=False, expected_position=100)
 
     @override
     async def async_stop_cover(self, **kwargs: Any) -> None:  # pyright: ignore[reportExplicitAny, reportAny]
-        _ = await self.hass.async_add_executor_job(
-            self.api.send_command, self._dev["sid"], "stop"
-        )
+        await self._async_send("stop")
+
+
+class SelveCommeoCover(SelveCoverBase):
+    """Cover entity for Commeo motor receivers (with position)."""
+
+    __slots__ = ()
+
+    _attr_supported_features: CoverEntityFeature | None = _CM_FEATURES
+
+    @override
+    def _update_cached_state(self) -> None:
+        dev = cast(SelveCommeoState, self._dev)
+        state = dev["state"]
+        position = state["position"]
+        pos = None if position == "-" else 100 - position
+        self._attr_current_cover_position = pos
+        # Assume 0 = fully closed
+        self._attr_is_closed = None if pos is None else pos == 0
+        self._attr_extra_state_attributes = {
+            "sid": self._sid,
+            "adr": dev["adr"],
+            "timeout": bool(state["timeout"]),
+            "flags": state["flags"],
+        }
+
+    @override
+    def _expected_dev(self, raw_position: int) -> SelveCommeoState:
+        dev = cast(SelveCommeoState, self._dev)
+        return {
+            **dev,
+            "state": {
+                **dev["state"],
+                "position": raw_position,
+                "target": raw_position,
+            },
+        }
 
     @override
     async def async_set_cover_position(self, **kwargs: Any) -> None:  # pyright: ignore[reportExplicitAny, reportAny]
         raw_position = cast(int, kwargs.get("position", 0))
         pos = 100 - raw_position
-        _ = await self.hass.async_add_executor_job(
-            self.api.send_command, self._dev["sid"], "moveTo", pos
+        current = self.current_cover_position
+        # No direction when the cover is unknown or already there
+        opening = (
+            None
+            if current is None or raw_position == current
+            else raw_position > current
         )
+        await self._async_send("moveTo", pos, opening, expected_position=pos)
+
+
+class SelveIveoCover(SelveCoverBase):
+    """Cover entity for Iveo receivers, which only report open or closed."""
+
+    __slots__ = ()
+
+    _attr_supported_features: CoverEntityFeature | None = _IV_FEATURES
+
+    @override
+    def _update_cached_state(self) -> None:
+        dev = cast(SelveIveoState, self._dev)
+        self._attr_is_closed = dev["state"] == "closed"
+        self._attr_extra_state_attributes = {"sid": self._sid, "adr": dev["adr"]}
 
-    @cached_property
     @override
-    def extra_state_attributes(self) -> dict[str, Any] | None:  # pyright: ignore[reportExplicitAny]
-        attributes: dict[str, Any] = {}  # pyright: ignore[reportExplicitAny]
-        attributes["sid"] = self._dev["sid"]
-        attributes["adr"] = self._dev["adr"]
-        if self._dev["type"] == "CM":
-            attrs = self._dev["state"]
-            attributes["timeout"] = bool(attrs["timeout"])
-            attributes["flags"] = self._dev["state"]["flags"]
-        return attributes
+    def _expected_dev(self, raw_position: int) -> SelveIveoState:
+        dev = cast(SelveIveoState, self._dev)
+        return {**dev, "state": "open" if raw_position == 0 else "closed"}
+
+
+# Device kinds served by a cover class, with a predicate selecting eligible devices
+COVER_DEVICE_TYPES: dict[
+    DeviceKind, tuple[Callable[[SelveState], bool], type[SelveCoverBase]]
+] = {
+    ("CM", "00"): (_is_commeo_motor, SelveCommeoCover),
+    ("IV", ""): (lambda _dev: True, SelveIveoCover),
+}
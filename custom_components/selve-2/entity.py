@@ -0,0 +1,84 @@
+from abc import abstractmethod
+from typing import override
+
+from aiohttp import ClientError
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
+
+from .const import SIGNAL_DEVICE_UPDATE
+from .server import SeleveHomeServer, SelveState, SelveStates
+
+
+class SelveDeviceEntity(CoordinatorEntity[DataUpdateCoordinator[SelveStates]]):
+    """Entity backed by a single device of a Selve Home Server.
+
+    Listens to coordinator refreshes and to the device's UDP push signal, and
+    only writes state when the device dict was replaced and a value exposed by
+    the entity actually changed.
+    """
+
+    __slots__ = ("api", "_entry_id", "_sid", "_last_dev", "_last_available")
+
+    def __init__(
+        self,
+        api: SeleveHomeServer,
+        coordinator: DataUpdateCoordinator[SelveStates],
+        entry_id: str,
+        sid: str,
+    ) -> None:
+        super().__init__(coordinator, context=sid)
+        self.api: SeleveHomeServer = api
+        self._entry_id: str = entry_id
+        self._sid: str = sid
+        self._last_dev: SelveState | None = coordinator.data.get(sid)
+        self._last_available: bool = coordinator.last_update_success
+
+    @abstractmethod
+    def _update_from(self, dev: SelveState | None) -> None:
+        """Derive the entity's _attr_* values from its device dict."""
+
+    @abstractmethod
+    def _observed_state(self) -> object:
+        """Return the values that end up in the state machine."""
+
+    async def _async_send_command(self, cmd: str, value: int | None = None) -> None:
+        """Send a command to the device, raising HomeAssistantError on failure."""
+        try:
+            _ = await self.api.async_send_command(self._sid, cmd, value)
+        except (ClientError, TimeoutError, ValueError) as err:
+            raise HomeAssistantError(
+                f"Selve command {cmd} for {self._sid} failed: {err}"
+            ) from err
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_UPDATE.format(self._entry_id, self._sid),
+                self._handle_coordinator_update,
+            )
+        )
+
+    @callback
+    @override
+    def _handle_coordinator_update(self) -> None:
+        dev = self.coordinator.data.get(self._sid)
+        available = self.coordinator.last_update_success
+        # Unchanged devices keep their dict object across polls and pushes
+        if dev is self._last_dev and available == self._last_available:
+            return
+        self._last_dev = dev
+        previous = self._observed_state()
+        self._update_from(dev)
+        # The dict may have been replaced for fields this entity does not expose
+        if self._observed_state() == previous and available == self._last_available:
+            return
+        self._last_available = available
+        super()._handle_coordinator_update()
@@ -1,23 +1,43 @@
-from asyncio import Task
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-import requests
-from typing import Any, Literal, TypeAlias, TypedDict, cast
+from asyncio import DatagramTransport
+from aiohttp import ClientSession, ClientTimeout
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Literal,
+    NotRequired,
+    TypeAlias,
+    TypedDict,
+    cast,
+)
 from enum import IntEnum
+from functools import lru_cache
 import base64
 import logging
 from ftfy import fix_encoding
+import orjson
+
+if TYPE_CHECKING:
+    from .coordinator import SelveCoordinator
 
 
 _LOGGER = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = ClientTimeout(total=10)
+
 
+@lru_cache(maxsize=512)
 def fix_mojibake(name: str) -> str:
     """Normalize encoding issues using ftfy.
 
-    Converts mojibake like 'GÃ¤stezimmer' to 'Gästezimmer'.
+    Converts mojibake like 'GÃ¤stezimmer' to 'Gästezimmer'. Device names rarely
+    change between polls, so results are cached.
     """
     if not name:
         return name
+    # Pure ASCII cannot contain mojibake
+    if name.isascii():
+        return name.strip()
     # fix_encoding handles double-encoding; strip preserves user spacing
     return fix_encoding(name).strip()
 
@@ -61,11 +81,7 @@ ETYPE_LABELS: dict[int, str] = {
 }
 
 
-def label_for_e_type(code: int | None) -> str | None:
-    if code is None:
-        return None
-    if code in ETYPE_LABELS:
-        return ETYPE_LABELS[code]
+def _fallback_e_type_label(code: int) -> str:
     if 8 <= code <= 15:
         return "Unknown Motor Type"
     if 22 <= code <= 31:
@@ -73,6 +89,18 @@ def label_for_e_type(code: int | None) -> str | None:
     return "Unknown"
 
 
+# Label for every code 0..31, indexed by code
+_ETYPE_LUT: tuple[str, ...] = tuple(
+    ETYPE_LABELS.get(code) or _fallback_e_type_label(code) for code in range(32)
+)
+
+
+def label_for_e_type(code: int | None) -> str | None:
+    if code is None:
+        return None
+    return _ETYPE_LUT[code] if 0 <= code < 32 else "Unknown"
+
+
 class ServerInfo(TypedDict):
     """Represents the server information returned by the SELVE-Home system."""
 
@@ -207,7 +235,7 @@ class SelveRawCommeoDeviceState(TypedDict):
     target: int
     flags: str
     timeout: int
-    parsed_flags: SelveCommeoDeviceFlags | None
+    parsed_flags: NotRequired[SelveCommeoDeviceFlags | None]
 
 
 class SelveRawCommeoState(TypedDict):
@@ -307,133 +335,197 @@ def parseCommeoRawFlags(
     raw_flags = raw_state.get("flags", "-")
     if raw_flags == "-":
         return None
+    return _parse_flags_value(raw_flags)
+
+
+# (flag, mask) for flags set when their bit is 1; sensor_connected is inverted
+_FLAG_BITS: tuple[tuple[str, int], ...] = (
+    ("timeout", 0x001),
+    ("overload", 0x002),
+    ("obstacle", 0x004),
+    ("emergency_alarm", 0x008),
+    ("sensor_learned", 0x010),
+    ("automatic_mode", 0x040),
+    ("cc_timeout", 0x080),
+    ("wind_alarm", 0x100),
+    ("rain_alarm", 0x200),
+    ("frost_alarm", 0x400),
+)
+_SENSOR_LOST_MASK = 0x020
+
+
+@lru_cache(maxsize=256)
+def _parse_flags_value(raw_flags: str) -> SelveCommeoDeviceFlags:
+    """Decode a 4 hex digit flags value.
+
+    Only a handful of distinct values occur, so results are cached and the same
+    dict is shared by every device and poll reporting that value. Treat it as
+    read-only.
+    """
+    # Runs once per distinct value thanks to the cache
     if len(raw_flags) != 4:
         raise ValueError("Flags string must be 4 hex digits")
     flags = int(raw_flags, 16)
-    parsed_flags: SelveCommeoDeviceFlags = {
-        "timeout": bool(flags & (1 << 0)),
-        "overload": bool(flags & (1 << 1)),
-        "obstacle": bool(flags & (1 << 2)),
-        "emergency_alarm": bool(flags & (1 << 3)),
-        "sensor_learned": bool(flags & (1 << 4)),
-        "sensor_connected": not bool(flags & (1 << 5)),
-        "automatic_mode": bool(flags & (1 << 6)),
-        "cc_timeout": bool(flags & (1 << 7)),
-        "wind_alarm": bool(flags & (1 << 8)),
-        "rain_alarm": bool(flags & (1 << 9)),
-        "frost_alarm": bool(flags & (1 << 10)),
-    }
+    parsed_flags = cast(
+        SelveCommeoDeviceFlags, {key: bool(flags & mask) for key, mask in _FLAG_BITS}
+    )
+    parsed_flags["sensor_connected"] = not flags & _SENSOR_LOST_MASK
     return parsed_flags
 
 
 def parseCommeoRawState(raw_state: SelveRawCommeoState) -> SelveCommeoState:
-    eType = int(raw_state["eType"])
-    state: SelveCommeoState = {
-        **raw_state,
-        "name": fix_mojibake(raw_state.get("name")),
-        "eType": eType,
-        "state": {
-            **raw_state["state"],
-            "parsed_flags": parseCommeoRawFlags(raw_state["state"]),
-        },
-    }
+    """Convert a freshly decoded Commeo state in place.
+
+    The raw dict comes straight from the JSON decoder and is not referenced
+    anywhere else, so it is updated instead of copied.
+    """
+    state = cast(SelveCommeoState, raw_state)
+    state["name"] = fix_mojibake(raw_state.get("name"))
+    state["eType"] = int(raw_state["eType"])
+    parsed_flags = parseCommeoRawFlags(raw_state["state"])
+    # Devices reporting "-" simply have no parsed_flags key
+    if parsed_flags is not None:
+        state["state"]["parsed_flags"] = parsed_flags
     return state
 
 
+def _add_commeo_state(state: SelveRawState, states: SelveStates) -> None:
+    state = cast(SelveRawCommeoState, state)
+    try:
+        states[state["sid"]] = parseCommeoRawState(state)
+    except Exception as e:
+        _LOGGER.error(
+            "Failed to parse Commeo state for sid %s: %s raw=%s",
+            state["sid"],
+            e,
+            state,
+        )
+
+
+def _add_iveo_state(state: SelveRawState, states: SelveStates) -> None:
+    state = cast(SelveIveoState, state)
+    states[state["sid"]] = state
+
+
+@lru_cache(maxsize=128)
+def _decode_group_name(b64: str) -> str:
+    """Decode a base64 group name; group names practically never change."""
+    return base64.b64decode(b64).decode("utf-8", errors="replace").strip()
+
+
+def _add_group_state(state: SelveRawState, states: SelveStates) -> None:
+    state = cast(SelveRawDeviceGroupState, state)
+    state["name"] = _decode_group_name(state["name"])
+    states[state["sid"]] = state
+
+
+def _skip_state(_state: SelveRawState, _states: SelveStates) -> None:
+    """EVENT entries carry no device state."""
+
+
+_STATE_HANDLERS: dict[str, Callable[[SelveRawState, SelveStates], None]] = {
+    "CM": _add_commeo_state,
+    "IV": _add_iveo_state,
+    "SGROUP": _add_group_state,
+    "EVENT": _skip_state,
+}
+
+
+def parseRawStates(data: SelveRawStates) -> SelveStates:
+    states: SelveStates = {}
+    for state in data:
+        handler = _STATE_HANDLERS.get(state["type"])
+        if handler is None:
+            _LOGGER.debug("Unknown state type: %s raw=%s", state["type"], state)
+        else:
+            handler(state, states)
+    return states
+
+
 class SeleveHomeServer:
-    def __init__(self, host: str, password: str):
+    def __init__(self, host: str, password: str, session: ClientSession):
         if not (host.startswith("https://") or host.startswith("http://")):
             host = f"http://{host}"
         self.host: str = host
         self.password: str = password
-
-    def request(self, method: str, path: str, data: Any | None = None):  # pyright: ignore[reportExplicitAny]
-        url = f"{self.host}{path}"
-        url += f"?auth={self.password}"
-        response = requests.request(method, url, json=data)
-        return response
-
-    def get_server_info(self) -> ServerInfo:
-        response = self.request("GET", "/info")
-        if response.status_code == 200 and "XC_SUC" in response.json():
-            data = cast(ServerInfo, response.json()["XC_SUC"])
+        self.session: ClientSession = session
+
+    async def async_request(
+        self,
+        method: str,
+        path: str,
+        data: Any | None = None,  # pyright: ignore[reportExplicitAny]
+        params: dict[str, str] | None = None,
+    ) -> tuple[int, bytes]:
+        """Send a request through the shared aiohttp session.
+
+        The password is added as the auth query parameter; aiohttp encodes the
+        query. Returns the status code and the raw response body, which orjson
+        parses without a separate text decode.
+        """
+        query = {**params, "auth": self.password} if params else {"auth": self.password}
+        async with self.session.request(
+            method,
+            f"{self.host}{path}",
+            params=query,
+            json=data,
+            timeout=REQUEST_TIMEOUT,
+        ) as response:
+            return response.status, await response.read()
+
+    async def async_get_server_info(self) -> ServerInfo:
+        status, body = await self.async_request("GET", "/info")
+        payload = orjson.loads(body) if status == 200 else None
+        if isinstance(payload, dict) and "XC_SUC" in payload:
+            data = cast(ServerInfo, payload["XC_SUC"])
             return {**data, "name": fix_mojibake(data.get("name", ""))}
-        else:
-            raise ValueError(
-                f"Failed to get server info: {response.status_code} {response.text}"
-            )
-
-    def request_cmd(self, params: dict[str, str]):
-        params["auth"] = self.password
-        url = "/cmd?auth=" + self.password
-        url += "&" + "&".join(f"{k}={v}" for k, v in params.items())
-        response = self.request("GET", url)
-        if response.status_code == 200:
-            if len(response.text) == 0:
+        text = body.decode(errors="replace")
+        raise ValueError(f"Failed to get server info: {status} {text}")
+
+    async def async_request_cmd(self, params: dict[str, str]):
+        status, body = await self.async_request("GET", "/cmd", params=params)
+        if status == 200:
+            if len(body) == 0:
                 raise ValueError("Empty response")
             try:
-                json_data = response.json()
+                json_data = orjson.loads(body)
             except Exception as e:
-                _LOGGER.error(
-                    'Failed to parse response: %s response: "%s"', e, response.text
-                )
+                _LOGGER.error('Failed to parse response: %s response: "%s"', e, body)
                 return None
             if "XC_SUC" in json_data:
                 return json_data["XC_SUC"]
-            raise ValueError(
-                f'Failed to execute command: {response.status_code} "{response.text}"'
-            )
+            text = body.decode(errors="replace")
+            raise ValueError(f'Failed to execute command: {status} "{text}"')
 
-    def get_all(self):
-        return self.request_cmd({"XC_FNC": "GetAll"})
+    async def async_get_all(self):
+        return await self.async_request_cmd({"XC_FNC": "GetAll"})
 
-    def get_states(self):
+    async def async_get_states(self):
         """Get the states of all devices connected to the system."""
         data = cast(
             SelveRawStates | None,
-            self.request_cmd({"XC_FNC": "GetStates", "config": "1"}),
+            await self.async_request_cmd({"XC_FNC": "GetStates", "config": "1"}),
         )
         if data is None:
             return None
-        states: SelveStates = {}
-        for state in data:
-            if state["type"] == "CM":
-                try:
-                    states[state["sid"]] = parseCommeoRawState(state)
-                except Exception as e:
-                    _LOGGER.error(
-                        "Failed to parse Commeo state for sid %s: %s raw=%s",
-                        state["sid"],
-                        e,
-                        state,
-                    )
-            elif state["type"] == "IV":
-                states[state["sid"]] = state
-            elif state["type"] == "SGROUP":
-                state["name"] = (
-                    base64.b64decode(state["name"])
-                    .decode("utf-8", errors="replace")
-                    .strip()
-                )
-                states[state["sid"]] = state
-            elif state["type"] != "EVENT":
-                _LOGGER.debug("Unknown state type: %s raw=%s", state["type"], state)
-        return states
-
-    def get_config(self, type: str, adr: str):
+        return parseRawStates(data)
+
+    async def async_get_config(self, type: str, adr: str):
         """Get the configuration of a device by its RF address."""
-        data = self.request_cmd({"XC_FNC": "GetConfig", "adr": adr, "type": type})
+        data = await self.async_request_cmd(
+            {"XC_FNC": "GetConfig", "adr": adr, "type": type}
+        )
         if data:
             return data
         else:
             raise Exception(f"Failed to get config for address {adr}")
 
-    def get_commeo_config(self, adr: str):
+    async def async_get_commeo_config(self, adr: str):
         """Get the configuration of a Commeo device by its RF address."""
-        return self.get_config("CM", adr)
+        return await self.async_get_config("CM", adr)
 
-    def send_command(self, device_id: str, cmd: str, value: int | None = None):
-        """id = device sid"""
+    @staticmethod
+    def _command_payload(device_id: str, cmd: str, value: int | None):
         data: dict[str, Any] = {  # pyright: ignore[reportExplicitAny]
             "XC_FNC": "SendGenericCmd",
             "id": device_id,
@@ -443,15 +535,30 @@ class SeleveHomeServer:
         }
         if value is not None:
             data["data"]["value"] = value
-        response = self.request("POST", "/cmd", data)
-        return response
+        return data
+
+    async def async_send_command(
+        self, device_id: str, cmd: str, value: int | None = None
+    ):
+        """id = device sid
+
+        Raises ValueError when the server does not confirm the command.
+        """
+        data = self._command_payload(device_id, cmd, value)
+        status, body = await self.async_request("POST", "/cmd", data)
+        payload = orjson.loads(body) if status == 200 and body else None
+        if isinstance(payload, dict) and "XC_SUC" in payload:
+            return payload["XC_SUC"]
+        text = body.decode(errors="replace")
+        raise ValueError(f'Failed to execute command: {status} "{text}"')
 
 
 class UDPState(TypedDict):
     """Represents the UDP state update for a device."""
 
     state: dict[str, SelveRawCommeoDeviceState]
-    ts: float
+    ts: int
+    """monotonic_ns() at receive time"""
 
 
 class DataStoreDict(TypedDict):
@@ -461,5 +568,5 @@ class DataStoreDict(TypedDict):
     server_info: ServerInfo
     devices: SelveStates | None
     udp_last: dict[str, UDPState]
-    coordinator: DataUpdateCoordinator[SelveStates]
-    udp_task: Task[None] | None
+    coordinator: "SelveCoordinator"
+    udp_transport: DatagramTransport | None
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-from functools import cached_property
 from typing import cast, override
 
-from requests import Response
-
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -13,10 +10,12 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN, DATA_API, DATA_SERVER_INFO
+from .entity import SelveDeviceEntity
 from .server import (
     DataStoreDict,
     SeleveHomeServer,
     SelveCommeoState,
+    SelveState,
     SelveStates,
 )
 
@@ -26,80 +25,69 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
-    data = cast(DataStoreDict, hass.data[DOMAIN][entry.entry_id])
+    data: DataStoreDict = hass.data[DOMAIN][entry.entry_id]
     api: SeleveHomeServer = data[DATA_API]
     coordinator = data["coordinator"]
     server_info = data[DATA_SERVER_INFO]
     parent_identifier: tuple[str, str] = (DOMAIN, f"server_{server_info['mac']}")
 
-    entities: list[SwitchEntity] = []
-    for dev in coordinator.data.values():
-        if dev["type"] != "CM":
-            continue
-        if dev["deviceType"] != "00":
-            continue
-        entities.append(
-            SelveAutomaticModeSwitch(api, coordinator, dev, parent_identifier)
+    receiver_sids = coordinator.sids_by_kind().get(("CM", "00"))
+    if not receiver_sids:
+        return
+    async_add_entities(
+        SelveAutomaticModeSwitch(
+            api,
+            coordinator,
+            entry.entry_id,
+            cast(SelveCommeoState, coordinator.data[sid]),
+            parent_identifier,
         )
+        for sid in receiver_sids
+    )
+
 
-    async_add_entities(entities)
+class SelveAutomaticModeSwitch(SelveDeviceEntity, SwitchEntity):
+    __slots__ = ()
 
+    _attr_device_class: SwitchDeviceClass | None = SwitchDeviceClass.SWITCH
+    _attr_has_entity_name: bool = True
+    _attr_translation_key: str | None = "automatic_mode"
 
-class SelveAutomaticModeSwitch(SwitchEntity):
     def __init__(
         self,
         api: SeleveHomeServer,
         coordinator: DataUpdateCoordinator[SelveStates],
+        entry_id: str,
         dev: SelveCommeoState,
         parent_identifier: tuple[str, str],
     ) -> None:
-        self.api: SeleveHomeServer = api
-        self.coordinator: DataUpdateCoordinator[SelveStates] = coordinator
-        self._sid: str = dev["sid"]
-        self._attr_device_class: SwitchDeviceClass | None = SwitchDeviceClass.SWITCH
+        super().__init__(api, coordinator, entry_id, dev["sid"])
         self._attr_unique_id: str | None = f"{DOMAIN}_{self._sid}_automatic_mode"
-        device_name = dev.get("name") or f"Receiver {self._sid}"
-        self._attr_name: str | None = f"{device_name} Automatic Mode"
-        self._attr_device_info: DeviceInfo | None = DeviceInfo(
-            identifiers={(DOMAIN, self._sid)},
-            via_device=parent_identifier,
-        )
+        self._attr_device_info: DeviceInfo | None = {
+            "identifiers": {(DOMAIN, self._sid)},
+            "via_device": parent_identifier,
+        }
+        self._update_from(self._last_dev)
 
     @override
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
-
-    def _handle_coordinator_update(self) -> None:
-        self.__dict__.pop("is_on", None)
-        self.async_write_ha_state()
+    def _update_from(self, dev: SelveState | None) -> None:
+        if dev is None or dev["type"] != "CM":
+            self._attr_is_on = None
+            return
+        flags = dev["state"].get("parsed_flags")
+        if not flags or "automatic_mode" not in flags:
+            self._attr_is_on = None
+            return
+        self._attr_is_on = bool(flags["automatic_mode"])
 
-    @cached_property
     @override
-    def is_on(self) -> bool | None:
-        dev = cast(SelveCommeoState | None, self.coordinator.data.get(self._sid))
-        if dev is None:
-            return None
-        flags = dev["state"].get("parsed_flags")
-        if not flags:
-            return None
-        if "automatic_mode" not in flags:
-            return None
-        return bool(flags["automatic_mode"])
+    def _observed_state(self) -> object:
+        return self._attr_is_on
 
     @override
     async def async_turn_on(self, **_kwargs: object) -> None:
-        _response: Response = await self.hass.async_add_executor_job(
-            self.api.send_command,
-            self._sid,
-            "auto",
-        )
+        await self._async_send_command("auto")
 
     @override
     async def async_turn_off(self, **_kwargs: object) -> None:
-        _response: Response = await self.hass.async_add_executor_job(
-            self.api.send_command,
-            self._sid,
-            "manu",
-        )
+        await self._async_send_command("manu")